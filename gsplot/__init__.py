@@ -9,7 +9,7 @@ from .figure.show import show
 from .hello_world.hello_world import hello_world
 from .logger import logger
 from .path.path import home, pwd, pwd_main, pwd_move
-from .plot.line import line
+from .plot.line import line, line_batch
 from .plot.line_colormap_dashed import line_colormap_dashed
 from .plot.line_colormap_solid import line_colormap_solid
 from .plot.scatter import scatter
@@ -72,6 +72,7 @@ __all__ = [
     "pwd_main",
     # plot/line.py
     "line",
+    "line_batch",
     # plot/line_colormap_solid.py
     "line_colormap_solid",
     # plot/line_colormap_dashed.py
@@ -1,11 +1,56 @@
 import inspect
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Callable
 
 from ..config.config import Config
 
 __all__: list[str] = []
 
+# Variadic parameter names that are not counted as bound parameters
+_IGNORE_KEYS: frozenset[str] = frozenset({"args", "kwargs"})
+
+
+@lru_cache(maxsize=None)
+def _get_signature(func: Callable) -> inspect.Signature:
+    """
+    Retrieves the signature of a function, inspected once per function.
+
+    Parameters
+    --------------------
+    func : Callable
+        The function to inspect.
+
+    Returns
+    --------------------
+    inspect.Signature
+        The signature of the function.
+    """
+    return inspect.signature(func)
+
+
+@lru_cache(maxsize=None)
+def _get_default_params(func: Callable) -> dict[str, Any]:
+    """
+    Retrieves the parameters with default values of a function, collected once per function.
+
+    The returned dictionary is shared between calls and must not be modified.
+
+    Parameters
+    --------------------
+    func : Callable
+        The function to inspect.
+
+    Returns
+    --------------------
+    dict of str, Any
+        A dictionary of default parameters.
+    """
+    return {
+        name: param.default
+        for name, param in _get_signature(func).parameters.items()
+        if param.default is not inspect.Parameter.empty
+    }
+
 
 class GetPassedParams:
     """
@@ -78,10 +123,8 @@ class GetPassedParams:
         int
             The count of arguments with default values.
         """
-        filtered_bound_arguments = {
-            k: v for k, v in bound_arguments.items() if k not in ["args", "kwargs"]
-        }
-        return len(filtered_bound_arguments)
+        # count without materializing a filtered copy of the bound arguments
+        return sum(1 for k in bound_arguments if k not in _IGNORE_KEYS)
 
     def create_passed_args(self, bound_arguments: dict[str, Any]) -> dict[str, Any]:
         """
@@ -145,7 +188,7 @@ class GetPassedParams:
         >>> print(params)
         {'a': 1, 'args': [3], 'kwargs': {'c': 4}}
         """
-        sig = inspect.signature(self.func)
+        sig = _get_signature(self.func)
         self.sig = sig
         bound_args = sig.bind_partial(*self.args, **self.kwargs)
         bound_args.apply_defaults()
@@ -155,9 +198,10 @@ class GetPassedParams:
         passe_args = self.create_passed_args(bound_arguments)
         passed_kwargs = self.crete_passed_kwargs(bound_arguments)
 
-        passed_params = {**passe_args, **passed_kwargs}
+        # merge into the freshly built args dict instead of allocating a third one
+        passe_args.update(passed_kwargs)
 
-        self.passed_params = passed_params
+        self.passed_params = passe_args
         return self.passed_params
 
 
@@ -281,12 +325,8 @@ class CreateClassParams:
         dict of str, Any
             A dictionary of default parameters.
         """
-        sig = inspect.signature(self.wrapped_func)
-        default_params = {
-            name: param.default
-            for name, param in sig.parameters.items()
-            if param.default is not inspect.Parameter.empty
-        }
+        # the signature is only inspected on the first call of each function
+        default_params = dict(_get_default_params(self.wrapped_func))
         return default_params
 
     def get_config_entry_params(self) -> dict[str, Any]:
@@ -303,18 +343,22 @@ class CreateClassParams:
             self.wrapped_func_name
         )
 
-        # decompose the config_entry_option following the structure of defaults_params
-        config_entry_params = {
-            key: config_entry_option[key]
-            for key in config_entry_option
-            if key in self.default_params
-        }
+        # most functions have no configuration entry, so there is nothing to decompose
+        if not config_entry_option:
+            return {"kwargs": {}}
 
-        config_entry_params["kwargs"] = {
-            key: value
-            for key, value in config_entry_option.items()
-            if key not in self.default_params
-        }
+        # decompose the config_entry_option following the structure of defaults_params
+        # in a single pass over the entry
+        default_params = self.default_params
+        config_entry_params: dict[str, Any] = {}
+        config_entry_kwargs: dict[str, Any] = {}
+        for key, value in config_entry_option.items():
+            if key in default_params:
+                config_entry_params[key] = value
+            else:
+                config_entry_kwargs[key] = value
+
+        config_entry_params["kwargs"] = config_entry_kwargs
         return config_entry_params
 
     def get_class_params(self) -> dict[str, Any]:
@@ -336,10 +380,14 @@ class CreateClassParams:
             **config_entry_params,
             **passed_params,
         }
-        class_params["kwargs"] = {
-            **config_entry_params.get("kwargs", {}),
-            **passed_params.get("kwargs", {}),
-        }
+
+        config_entry_kwargs = config_entry_params.get("kwargs", {})
+        passed_kwargs = passed_params.get("kwargs", {})
+        # only build a merged kwargs dict when both sides contribute entries
+        if config_entry_kwargs and passed_kwargs:
+            class_params["kwargs"] = {**config_entry_kwargs, **passed_kwargs}
+        else:
+            class_params["kwargs"] = passed_kwargs or config_entry_kwargs
         return class_params
 
 
@@ -1,5 +1,5 @@
 import inspect
-from typing import Any
+from typing import Any, Mapping
 
 from ..config.config import Config
 
@@ -16,7 +16,7 @@ class AliasValidator:
 
     Parameters
     --------------------
-    alias_map : dict of str, Any
+    alias_map : Mapping of str, Any
         A mapping of alias keys to their original parameter keys.
     passed_params : dict of str, Any
         The parameters explicitly passed to the function, including `kwargs`.
@@ -25,7 +25,7 @@ class AliasValidator:
     --------------------
     wrapped_func_name : str
         The name of the wrapped function where the validation is performed.
-    alias_map : dict of str, Any
+    alias_map : Mapping of str, Any
         The mapping of alias keys to original parameter keys.
     passed_params : dict of str, Any
         The explicitly passed parameters, updated during validation.
@@ -57,12 +57,12 @@ class AliasValidator:
 
     def __init__(
         self,
-        alias_map: dict[str, Any],
+        alias_map: Mapping[str, Any],
         passed_params: dict[str, Any],
     ) -> None:
         self.wrapped_func_name: str = self.get_wrapped_func_name()
 
-        self.alias_map: dict[str, Any] = alias_map
+        self.alias_map: Mapping[str, Any] = alias_map
         self.passed_params: dict[str, Any] = passed_params
         self.config_entry_option: dict[str, Any] = self.get_config_entry_option()
 
@@ -121,31 +121,31 @@ class AliasValidator:
             function call or configuration file.
         """
 
-        def checker_passed_params():
-            for alias, key in self.alias_map.items():
-                if alias in self.passed_params["kwargs"]:
-                    if key in self.passed_params:
-                        raise ValueError(
-                            f"The parameters '{alias}' and '{key}' cannot both be used simultaneously in the '{self.wrapped_func_name}' function."
-                        )
-                    self.passed_params[key] = self.passed_params["kwargs"][alias]
-                    del self.passed_params["kwargs"][alias]
-
-        def checker_config_entry_option(config_entry_option: dict[str, Any]):
-            for alias, key in self.alias_map.items():
-                if alias in config_entry_option:
-                    if key in config_entry_option:
-                        raise ValueError(
-                            f"The parameters '{alias}' and '{key}' cannot both be used simultaneously in the '{self.wrapped_func_name}' in the configuration file."
-                        )
-                    Config().config_dict[self.wrapped_func_name][key] = (
-                        config_entry_option[alias]
+        passed_kwargs: dict[str, Any] = self.passed_params["kwargs"]
+        config_entry_option: dict[str, Any] = self.config_entry_option
+
+        # Nothing can be aliased when neither the call nor the configuration has options
+        if not passed_kwargs and not config_entry_option:
+            return
+
+        # Check for duplicate kwargs in passed_params and config_entry_option in one pass
+        for alias, key in self.alias_map.items():
+            if alias in passed_kwargs:
+                if key in self.passed_params:
+                    raise ValueError(
+                        f"The parameters '{alias}' and '{key}' cannot both be used simultaneously in the '{self.wrapped_func_name}' function."
                     )
-                    del Config().config_dict[self.wrapped_func_name][alias]
+                self.passed_params[key] = passed_kwargs.pop(alias)
 
-        # Check for duplicate kwargs in passed_params and config_entry_option
-        checker_passed_params()
-        checker_config_entry_option(self.config_entry_option)
+            if alias in config_entry_option:
+                if key in config_entry_option:
+                    raise ValueError(
+                        f"The parameters '{alias}' and '{key}' cannot both be used simultaneously in the '{self.wrapped_func_name}' in the configuration file."
+                    )
+                Config().config_dict[self.wrapped_func_name][key] = (
+                    config_entry_option[alias]
+                )
+                del Config().config_dict[self.wrapped_func_name][alias]
 
     def validate(self):
         """
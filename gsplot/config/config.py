@@ -91,10 +91,12 @@ class Config:
         Config
             The singleton instance of the Config class.
         """
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super(Config, cls).__new__(cls)
-                cls._instance._initialize_config_dict()
+        # Double-checked locking: the lock is only taken while the instance is created
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(Config, cls).__new__(cls)
+                    cls._instance._initialize_config_dict()
         return cls._instance
 
     def _initialize_config_dict(self) -> None:
@@ -281,23 +281,30 @@ class AxesRangeSingleton:
             x: NDArray[Any] = self.x
             y: NDArray[Any] = self.y
 
+            # resolve the singleton once per call instead of once per use
+            axes_range = cls()
+
             xrange, yrange = AxisRangeHandler(ax, x, y).get_new_axis_range()
-            xrange = np.array([cls().get_min_wo_inf(x), cls().get_max_wo_inf(x)])
-            yrange = np.array([cls().get_min_wo_inf(y), cls().get_max_wo_inf(y)])
+            xrange = np.array(
+                [axes_range.get_min_wo_inf(x), axes_range.get_max_wo_inf(x)]
+            )
+            yrange = np.array(
+                [axes_range.get_min_wo_inf(y), axes_range.get_max_wo_inf(y)]
+            )
 
-            xrange_singleton, yrange_singleton = cls().get_axes_range(ax)
+            xrange_singleton, yrange_singleton = axes_range.get_axes_range(ax)
 
             if xrange_singleton is not None:
-                new_xrange = cls()._get_wider_range(xrange, xrange_singleton)
+                new_xrange = axes_range._get_wider_range(xrange, xrange_singleton)
             else:
                 new_xrange = xrange
 
             if yrange_singleton is not None:
-                new_yrange = cls()._get_wider_range(yrange, yrange_singleton)
+                new_yrange = axes_range._get_wider_range(yrange, yrange_singleton)
             else:
                 new_yrange = yrange
 
-            cls().add_range(ax, new_xrange, new_yrange)
+            axes_range.add_range(ax, new_xrange, new_yrange)
 
             result = func(self, *args, **kwargs)
             return result
@@ -1,5 +1,6 @@
 import numbers
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -14,7 +15,19 @@ from ..base.base_alias_validator import AliasValidator
 from ..figure.axes_range_base import AxesRangeSingleton
 from .line_base import AutoColor, NumLines
 
-__all__: list[str] = ["line"]
+__all__: list[str] = ["line", "line_batch"]
+
+_ALIAS_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "ms": "markersize",
+        "mew": "markeredgewidth",
+        "ls": "linestyle",
+        "lw": "linewidth",
+        "c": "color",
+        "mec": "markeredgecolor",
+        "mfc": "markerfacecolor",
+    }
+)
 
 
 class Line:
@@ -69,6 +82,30 @@ class Line:
     >>> line.plot()
     """
 
+    __slots__ = (
+        "ax",
+        "_x",
+        "_y",
+        "color",
+        "marker",
+        "markersize",
+        "markeredgewidth",
+        "markeredgecolor",
+        "markerfacecolor",
+        "linestyle",
+        "linewidth",
+        "alpha",
+        "alpha_mfc",
+        "label",
+        "args",
+        "kwargs",
+        "x",
+        "y",
+        "_color",
+        "_color_mec",
+        "_color_mfc",
+    )
+
     def __init__(
         self,
         ax: Axes,
@@ -118,24 +155,43 @@ class Line:
         """
         Sets the colors for the line, marker edge, and marker face.
         """
-        cycle_color: NDArray[Any] | str = AutoColor(self.ax).get_color()
-        if isinstance(cycle_color, np.ndarray):
-            cycle_color = colors.to_hex(
-                tuple(cycle_color)
-            )  # convert numpy array to tuple
-
-        default_color: ColorType = cycle_color if self.color is None else self.color
-
-        self._color = self._modify_color_alpha(default_color, self.alpha)
-        self._color_mec = self._modify_color_alpha(
-            self.markeredgecolor if self.markeredgecolor is not None else default_color,
-            self.alpha,
-        )
-        self._color_mfc = self._modify_color_alpha(
-            self.markerfacecolor if self.markerfacecolor is not None else default_color,
-            self.alpha_mfc * self.alpha,
+        # the cycle color is only looked up when no color is given
+        default_color: ColorType = (
+            AutoColor.get_cycle_color_hex(self.ax) if self.color is None else self.color
         )
 
+        self._color, self._color_mec, self._color_mfc = self._get_colors(default_color)
+
+    def _get_colors(self, default_color: ColorType) -> tuple[tuple, tuple, tuple]:
+        """
+        Resolves the line, marker edge, and marker face colors for a line color.
+
+        Parameters
+        --------------------
+        default_color : ColorType
+            The color of the line.
+
+        Returns
+        --------------------
+        tuple of tuple
+            The RGBA colors of the line, marker edge, and marker face.
+        """
+        color = self._modify_color_alpha(default_color, self.alpha)
+
+        # Colors falling back to the line color reuse its parsed RGB
+        if self.markeredgecolor is None:
+            color_mec = color
+        else:
+            color_mec = self._modify_color_alpha(self.markeredgecolor, self.alpha)
+
+        if self.markerfacecolor is None:
+            color_mfc = color[:3] + (float(self.alpha_mfc * self.alpha),)
+        else:
+            color_mfc = self._modify_color_alpha(
+                self.markerfacecolor, self.alpha_mfc * self.alpha
+            )
+        return color, color_mec, color_mfc
+
     def _modify_color_alpha(self, color: ColorType, alpha: float | int | None) -> tuple:
         """
         Modifies the alpha value of the given color.
@@ -163,9 +219,8 @@ class Line:
         if not isinstance(alpha, numbers.Real):
             raise ValueError("Alpha must be a float")
 
-        rgb = list(colors.to_rgba(color))
-        rgb[3] = float(alpha)
-        return tuple(rgb)
+        r, g, b, _ = colors.to_rgba(color)
+        return (r, g, b, float(alpha))
 
     @NumLines.count
     @AxesRangeSingleton.update
@@ -201,6 +256,222 @@ class Line:
         return _plot
 
 
+class LineBatch(Line):
+    """
+    A utility class for plotting several lines that share the same style on a specified axis.
+
+    The lines are given as 2D arrays of shape (N_lines, N_points), so the parameter
+    handling, the `NumLines` bookkeeping and the axis range update are performed once
+    for the whole batch instead of once per line.
+
+    Parameters
+    --------------------
+    ax : matplotlib.axes.Axes
+        The target axis where the lines should be plotted.
+    x : ArrayLike
+        The x-coordinates, either shared by all lines with shape (N_points,) or
+        given per line with shape (N_lines, N_points).
+    y : ArrayLike
+        The y-coordinates with shape (N_lines, N_points).
+    color : ColorType, optional
+        The color of all lines (default is None, which cycles the auto color per line).
+    marker : MarkerType, optional
+        The marker style (default is "o").
+    markersize : int or float, optional
+        The size of the marker (default is 7.0).
+    markeredgewidth : int or float, optional
+        The width of the marker edge (default is 1.5).
+    markeredgecolor : ColorType, optional
+        The color of the marker edge (default is None, which uses the line color).
+    markerfacecolor : ColorType, optional
+        The color of the marker face (default is None, which uses the line color with modified alpha).
+    linestyle : LineStyleType, optional
+        The line style (default is "--").
+    linewidth : int or float, optional
+        The width of the line (default is 1.0).
+    alpha : int or float, optional
+        The opacity of the lines (default is 1.0).
+    alpha_mfc : int or float, optional
+        The opacity of the marker face color (default is 0.2).
+    label : str, optional
+        The label for the batch, attached to the first line only (default is None).
+    *args : Any
+        Additional positional arguments passed to `Axes.plot`.
+    **kwargs : Any
+        Additional keyword arguments passed to `Axes.plot`.
+
+    Notes
+    --------------------
+    - When `color` is given, all lines are drawn with a single `Axes.plot` call.
+    - When `color` is None, each line gets its own auto color and `Axes.plot` is
+      called once per line, still sharing the single decorator pass.
+
+    Methods
+    --------------------
+    verify_shape(x, y)
+        Verifies that the x and y arrays describe a batch of lines.
+    plot()
+        Plots the lines on the specified axis.
+
+    Examples
+    --------------------
+    >>> x = np.linspace(0, 1, 10)
+    >>> y = np.vstack([x, x**2, x**3])
+    >>> line_batch = LineBatch(ax, x, y, linestyle="-")
+    >>> line_batch.plot()
+    """
+
+    __slots__ = ("num_batch", "_colors")
+
+    def __init__(
+        self,
+        ax: Axes,
+        x: ArrayLike,
+        y: ArrayLike,
+        color: ColorType | None = None,
+        marker: MarkerType = "o",
+        markersize: int | float = 7.0,
+        markeredgewidth: int | float = 1.5,
+        markeredgecolor: ColorType | None = None,
+        markerfacecolor: ColorType | None = None,
+        linestyle: LineStyleType = "--",
+        linewidth: int | float = 1.0,
+        alpha: int | float = 1.0,
+        alpha_mfc: int | float = 0.2,
+        label: str | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        x = np.asarray(x)
+        y = np.asarray(y)
+        self.verify_shape(x, y)
+        self.num_batch: int = y.shape[0]
+
+        super().__init__(
+            ax,
+            x,
+            y,
+            color,
+            marker,
+            markersize,
+            markeredgewidth,
+            markeredgecolor,
+            markerfacecolor,
+            linestyle,
+            linewidth,
+            alpha,
+            alpha_mfc,
+            label,
+            *args,
+            **kwargs,
+        )
+
+    @staticmethod
+    def verify_shape(x: NDArray[Any], y: NDArray[Any]) -> None:
+        """
+        Verifies that the x and y arrays describe a batch of lines.
+
+        Parameters
+        --------------------
+        x : numpy.ndarray
+            The x-coordinates, with shape (N_points,) or (N_lines, N_points).
+        y : numpy.ndarray
+            The y-coordinates, with shape (N_lines, N_points).
+
+        Raises
+        --------------------
+        ValueError
+            If `y` is not 2D or `x` does not match the shape of `y`.
+        """
+        if y.ndim != 2:
+            raise ValueError("y must have the shape (N_lines, N_points)")
+        if x.shape != y.shape and x.shape != y.shape[1:]:
+            raise ValueError(
+                "x must have the shape (N_points,) or (N_lines, N_points) matching y"
+            )
+
+    def _set_colors(self) -> None:
+        """
+        Sets the colors for the lines, marker edges, and marker faces of the batch.
+        """
+        if self.color is not None:
+            super()._set_colors()
+            self._colors: list[tuple[tuple, tuple, tuple]] = [
+                (self._color, self._color_mec, self._color_mfc)
+            ]
+            return
+
+        colormap_hex = AutoColor.get_colormap_hex(
+            AutoColor.CMAP, AutoColor.COLORMAP_LENGTH
+        )
+        num_lines = NumLines().num_lines(self.ax)
+
+        self._colors = [
+            self._get_colors(
+                colormap_hex[(num_lines + i) % AutoColor.COLORMAP_LENGTH]
+            )
+            for i in range(self.num_batch)
+        ]
+
+    @AxesRangeSingleton.update
+    def plot(self) -> list[Line2D]:
+        """
+        Plots the lines on the specified axis.
+
+        Returns
+        --------------------
+        list of matplotlib.lines.Line2D
+            The list of Line2D objects, one per line of the batch.
+
+        Examples
+        --------------------
+        >>> line_batch = LineBatch(ax, [0, 1, 2], [[0, 1, 2], [2, 1, 0]], color="blue")
+        >>> line_batch.plot()
+        """
+        # matplotlib plots the columns of 2D arrays as separate lines
+        x = self.x.T if self.x.ndim == 2 else self.x
+
+        style: dict[str, Any] = dict(
+            marker=self.marker,
+            markersize=self.markersize,
+            markeredgewidth=self.markeredgewidth,
+            linestyle=self.linestyle,
+            linewidth=self.linewidth,
+        )
+
+        _plot: list[Line2D] = []
+        if len(self._colors) == 1:
+            color, color_mec, color_mfc = self._colors[0]
+            _plot = self.ax.plot(
+                x,
+                self.y.T,
+                color=color,
+                markeredgecolor=color_mec,
+                markerfacecolor=color_mfc,
+                *self.args,
+                **style,
+                **self.kwargs,
+            )
+        else:
+            for i, (color, color_mec, color_mfc) in enumerate(self._colors):
+                _plot += self.ax.plot(
+                    x[:, i] if x.ndim == 2 else x,
+                    self.y[i],
+                    color=color,
+                    markeredgecolor=color_mec,
+                    markerfacecolor=color_mfc,
+                    *self.args,
+                    **style,
+                    **self.kwargs,
+                )
+
+        if self.label is not None and _plot:
+            _plot[0].set_label(self.label)
+
+        NumLines().increment(self.ax, self.num_batch)
+        return _plot
+
+
 @bind_passed_params()
 def line(
     ax: Axes,
@@ -289,18 +560,8 @@ def line(
     [<matplotlib.lines.Line2D object at 0x...>]
     """
 
-    alias_map = {
-        "ms": "markersize",
-        "mew": "markeredgewidth",
-        "ls": "linestyle",
-        "lw": "linewidth",
-        "c": "color",
-        "mec": "markeredgecolor",
-        "mfc": "markerfacecolor",
-    }
-
     passed_params: dict[str, Any] = ParamsGetter("passed_params").get_bound_params()
-    AliasValidator(alias_map, passed_params).validate()
+    AliasValidator(_ALIAS_MAP, passed_params).validate()
     class_params: dict[str, Any] = CreateClassParams(passed_params).get_class_params()
 
     _line = Line(
@@ -323,3 +584,124 @@ def line(
     )
 
     return _line.plot()
+
+
+@bind_passed_params()
+def line_batch(
+    ax: Axes,
+    x: ArrayLike,
+    y: ArrayLike,
+    color: ColorType | None = None,
+    marker: MarkerType = "o",
+    markersize: int | float = 7.0,
+    markeredgewidth: int | float = 1.5,
+    markeredgecolor: ColorType | None = None,
+    markerfacecolor: ColorType | None = None,
+    linestyle: LineStyleType = "--",
+    linewidth: int | float = 1.0,
+    alpha: int | float = 1,
+    alpha_mfc: int | float = 0.2,
+    label: str | None = None,
+    *args: Any,
+    **kwargs: Any,
+) -> list[Line2D]:
+    """
+    A convenience function to plot several lines sharing the same style on a Matplotlib axis.
+
+    This function wraps the `LineBatch` class. The lines are given as rows of 2D arrays,
+    and the parameter handling, automatic color cycling, and axis range update are
+    performed once for the whole batch.
+
+    Parameters
+    --------------------
+    ax : matplotlib.axes.Axes
+        The target axis where the lines should be plotted.
+    x : ArrayLike
+        The x-coordinates, either shared by all lines with shape (N_points,) or
+        given per line with shape (N_lines, N_points).
+    y : ArrayLike
+        The y-coordinates with shape (N_lines, N_points).
+    color : ColorType or None, optional
+        The color of all lines (default is `None`, cycling the auto color per line).
+    marker : MarkerType, optional
+        The marker style for the data points (default is "o").
+    markersize : int or float, optional
+        The size of the markers (default is 7.0).
+    markeredgewidth : int or float, optional
+        The width of the marker edges (default is 1.5).
+    markeredgecolor : ColorType or None, optional
+        The edge color of the markers (default is `None`).
+    markerfacecolor : ColorType or None, optional
+        The face color of the markers (default is `None`).
+    linestyle : LineStyleType, optional
+        The style of the lines (default is "--").
+    linewidth : int or float, optional
+        The width of the lines (default is 1.0).
+    alpha : int or float, optional
+        The transparency level of the lines (default is 1).
+    alpha_mfc : int or float, optional
+        The transparency level of the marker face color (default is 0.2).
+    label : str or None, optional
+        The label for the batch, attached to the first line only (default is `None`).
+    *args : Any
+        Additional positional arguments passed to `matplotlib.axes.Axes.plot`.
+    **kwargs : Any
+        Additional keyword arguments passed to `matplotlib.axes.Axes.plot`.
+
+    Notes
+    --------------------
+    - This function utilizes the `ParamsGetter` to retrieve bound parameters and the `CreateClassParams` class to handle the merging of default, configuration, and passed parameters.
+    - Alias validation is performed using the `AliasValidator` class, with the same aliases as `line`.
+
+        - 'ms' (markersize)
+        - 'mew' (markeredgewidth)
+        - 'ls' (linestyle)
+        - 'lw' (linewidth)
+        - 'c' (color)
+        - 'mec' (markeredgecolor)
+        - 'mfc' (markerfacecolor).
+
+    Returns
+    --------------------
+    list of matplotlib.lines.Line2D
+        The list of Line2D objects, one per line of the batch.
+
+    Raises
+    --------------------
+    ValueError
+        If `y` is not 2D or `x` does not match the shape of `y`.
+
+    Examples
+    --------------------
+    >>> import gsplot as gs
+    >>> x = np.linspace(0, 1, 10)
+    >>> y = np.vstack([x, x**2, x**3])
+    >>> lines = gs.line_batch(ax, x, y, ls="-")
+    >>> print(len(lines))
+    3
+    """
+
+    passed_params: dict[str, Any] = ParamsGetter("passed_params").get_bound_params()
+    AliasValidator(_ALIAS_MAP, passed_params).validate()
+    class_params: dict[str, Any] = CreateClassParams(passed_params).get_class_params()
+
+    _line_batch = LineBatch(
+        class_params["ax"],
+        class_params["x"],
+        class_params["y"],
+        class_params["color"],
+        class_params["marker"],
+        class_params["markersize"],
+        class_params["markeredgewidth"],
+        class_params["markeredgecolor"],
+        class_params["markerfacecolor"],
+        class_params["linestyle"],
+        class_params["linewidth"],
+        class_params["alpha"],
+        class_params["alpha_mfc"],
+        class_params["label"],
+        *class_params["args"],
+        **class_params["kwargs"],
+    )
+
+    return _line_batch.plot()
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import threading
+from functools import lru_cache
 from typing import Any, Callable, TypeVar, cast
 
-import numpy as np
+from matplotlib import colors
 from matplotlib.axes import Axes
 from numpy.typing import NDArray
 
@@ -32,7 +33,7 @@ class NumLines:
     --------------------
     num_lines_axis(ax)
         Retrieves the number of lines plotted on a specific axis.
-    increment(ax)
+    increment(ax, n=1)
         Increments the line count for a specific axis.
     count(func)
         A decorator to increment the line count whenever a plotting function is called.
@@ -50,10 +51,12 @@ class NumLines:
     _lock: threading.Lock = threading.Lock()  # Lock to ensure thread safety
 
     def __new__(cls) -> "NumLines":
-        with cls._lock:  # Ensure thread safety
-            if cls._instance is None:
-                cls._instance = super(NumLines, cls).__new__(cls)
-                cls._instance._initialize_num_lines()
+        # Double-checked locking: the lock is only taken while the instance is created
+        if cls._instance is None:
+            with cls._lock:  # Ensure thread safety
+                if cls._instance is None:
+                    cls._instance = super(NumLines, cls).__new__(cls)
+                    cls._instance._initialize_num_lines()
         return cls._instance
 
     def _initialize_num_lines(self) -> None:
@@ -99,11 +102,9 @@ class NumLines:
         >>> num_lines = NumLines()
         >>> print(num_lines.num_lines_axis(axs[0]))
         """
-        if ax not in self._num_lines_dict:
-            self._num_lines_dict[ax] = 0
-        return self._num_lines_dict[ax]
+        return self._num_lines_dict.get(ax, 0)
 
-    def increment(self, ax: Axes) -> None:
+    def increment(self, ax: Axes, n: int = 1) -> None:
         """
         Increments the line count for a specific axis.
 
@@ -111,15 +112,15 @@ class NumLines:
         --------------------
         ax : matplotlib.axes.Axes
             The axis to increment.
+        n : int, optional
+            The number of lines to add to the count (default is 1).
 
         Examples
         --------------------
         >>> num_lines = NumLines()
         >>> num_lines.increment(axs[1])
         """
-        if ax not in self._num_lines_dict:
-            self._num_lines_dict[ax] = 0
-        self._num_lines_dict[ax] += 1
+        self._num_lines_dict[ax] = self._num_lines_dict.get(ax, 0) + n
 
     @classmethod
     def count(cls, func: F) -> F:
@@ -144,7 +145,11 @@ class NumLines:
         """
 
         def wrapper(self, *args: Any, **kwargs: Any) -> Any:
-            cls().increment(self.ax)
+            # Read the live instance on each call (reset() replaces it) and
+            # increment the count inline, skipping __new__ and increment()
+            instance = cls._instance or cls()
+            num_lines_dict = instance._num_lines_dict
+            num_lines_dict[self.ax] = num_lines_dict.get(self.ax, 0) + 1
             result = func(self, *args, **kwargs)
             return result
 
@@ -166,7 +171,9 @@ class NumLines:
         >>> print(num_lines.num_lines_axis(0))
         0
         """
-        cls._instance = None
+        # Take the construction lock so a reset cannot interleave with __new__
+        with cls._lock:
+            cls._instance = None
 
 
 class AutoColor:
@@ -199,6 +206,12 @@ class AutoColor:
     --------------------
     get_color()
         Retrieves the next color from the colormap based on the current line count.
+    get_colormap(cmap, N)
+        Retrieves the discrete colormap, built once per `cmap` and `N`.
+    get_colormap_hex(cmap, N)
+        Retrieves the discrete colormap as hexadecimal strings, built once per `cmap` and `N`.
+    get_cycle_color_hex(ax)
+        Retrieves the next color for the target axis as a hexadecimal string.
 
     Examples
     --------------------
@@ -208,19 +221,106 @@ class AutoColor:
     array([0.267004, 0.004874, 0.329415, 1.0])  # Example RGBA color from the colormap
     """
 
+    COLORMAP_LENGTH: int = 5
+    CMAP: str = "viridis"
+
     def __init__(self, ax) -> None:
         self.ax: Axes = ax
-        self.COLORMAP_LENGTH: int = 5
-        self.CMAP = "viridis"
-        self.colormap: NDArray[Any] = Colormap(
-            cmap=self.CMAP, N=self.COLORMAP_LENGTH
-        ).get_split_cmap()
+        self.colormap: NDArray[Any] = self.get_colormap(
+            self.CMAP, self.COLORMAP_LENGTH
+        )
 
         _num_lines = NumLines()
         self.num_lines: int = _num_lines.num_lines(self.ax)
 
         self.cycle_color_index: int = self.num_lines % self.COLORMAP_LENGTH
 
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def get_colormap(cmap: str, N: int) -> NDArray[Any]:
+        """
+        Retrieves the discrete colormap used for automatic coloring.
+
+        The colormap is built once per `cmap` and `N` and shared by all lines,
+        instead of being recreated for every plotted line. The shared array is
+        read-only so that callers cannot modify the cached colors in place.
+
+        Parameters
+        --------------------
+        cmap : str
+            The name of the Matplotlib colormap to use.
+        N : int
+            The number of discrete colors in the colormap.
+
+        Returns
+        --------------------
+        numpy.ndarray
+            An array of RGBA colors derived from the specified colormap.
+
+        Examples
+        --------------------
+        >>> colormap = AutoColor.get_colormap("viridis", 5)
+        >>> print(colormap.shape)
+        (5, 4)
+        """
+        colormap: NDArray[Any] = Colormap(cmap=cmap, N=N).get_split_cmap()
+        colormap.setflags(write=False)
+        return colormap
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def get_colormap_hex(cmap: str, N: int) -> tuple[str, ...]:
+        """
+        Retrieves the discrete colormap as hexadecimal color strings.
+
+        The conversion is done once per `cmap` and `N`, so plotting a line does not
+        convert its default color again.
+
+        Parameters
+        --------------------
+        cmap : str
+            The name of the Matplotlib colormap to use.
+        N : int
+            The number of discrete colors in the colormap.
+
+        Returns
+        --------------------
+        tuple of str
+            The hexadecimal strings of the colormap colors.
+
+        Examples
+        --------------------
+        >>> AutoColor.get_colormap_hex("viridis", 5)[0]
+        '#440154'
+        """
+        return tuple(
+            colors.to_hex(tuple(color)) for color in AutoColor.get_colormap(cmap, N)
+        )
+
+    @classmethod
+    def get_cycle_color_hex(cls, ax: Axes) -> str:
+        """
+        Retrieves the next color for the target axis as a hexadecimal string.
+
+        Parameters
+        --------------------
+        ax : matplotlib.axes.Axes
+            The target `Axes` object for which to generate the color.
+
+        Returns
+        --------------------
+        str
+            The hexadecimal string of the color for the next line.
+
+        Examples
+        --------------------
+        >>> color = AutoColor.get_cycle_color_hex(ax)
+        >>> print(color)
+        '#440154'  # Example color
+        """
+        colormap_hex = cls.get_colormap_hex(cls.CMAP, cls.COLORMAP_LENGTH)
+        return colormap_hex[NumLines().num_lines(ax) % cls.COLORMAP_LENGTH]
+
     def get_color(self) -> NDArray[Any]:
         """
         Retrieves the next color from the colormap based on the current line count.
@@ -240,4 +340,5 @@ class AutoColor:
         >>> print(color)
         array([0.267004, 0.004874, 0.329415, 1.0])  # Example RGBA color
         """
-        return np.array(self.colormap[self.cycle_color_index])
+        cycle_color: NDArray[Any] = self.colormap[self.cycle_color_index]
+        return cycle_color
@@ -2,6 +2,7 @@ from typing import Any
 
 import numpy as np
 from matplotlib.colors import Normalize
+from numpy.lib.stride_tricks import sliding_window_view
 from numpy.typing import ArrayLike, NDArray
 
 __all__: list[str] = []
@@ -21,23 +22,27 @@ class LineColormapBase:
         segment coloring.
     _create_cmap(cmapdata)
         Creates a normalization object for mapping data points to colors.
+    _interpolate(cumulative_distances, interpolated_distances, *data)
+        Linearly interpolates several data arrays at the same distances.
+    _interpolate_points(x, y, cmapdata, interpolation_points)
+        Resamples a line and its colormap data at evenly spaced arc lengths.
 
     Examples
     --------------------
-    >>> line_base = LineColormapBase()
     >>> x = np.array([0, 1, 2, 3])
     >>> y = np.array([1, 2, 3, 4])
-    >>> segments = line_base._create_segment(x, y)
+    >>> segments = LineColormapBase._create_segment(x, y)
     >>> print(segments.shape)
     (3, 2, 2)  # Shape: (numlines, points per line, x and y)
 
     >>> cmapdata = np.array([0.1, 0.4, 0.6, 0.9])
-    >>> norm = line_base._create_cmap(cmapdata)
+    >>> norm = LineColormapBase._create_cmap(cmapdata)
     >>> print(norm(cmapdata))
     [0.   0.5  0.83333333 1.  ]  # Normalized data
     """
 
-    def _create_segment(self, x: ArrayLike, y: ArrayLike) -> NDArray[np.float64]:
+    @staticmethod
+    def _create_segment(x: ArrayLike, y: ArrayLike) -> NDArray[np.float64]:
         """
         Creates a set of line segments for line collections, enabling individual segment coloring.
 
@@ -56,14 +61,14 @@ class LineColormapBase:
         --------------------
         numpy.ndarray
             An array of shape `(numlines, 2, 2)` representing the line segments,
-            where each segment is defined by two points `(x, y)`.
+            where each segment is defined by two points `(x, y)`. The array is a
+            read-only view sharing memory between adjacent segments.
 
         Examples
         --------------------
         >>> x = np.array([0, 1, 2, 3])
         >>> y = np.array([1, 2, 3, 4])
-        >>> line_base = LineColormapBase()
-        >>> segments = line_base._create_segment(x, y)
+        >>> segments = LineColormapBase._create_segment(x, y)
         >>> print(segments.shape)
         (3, 2, 2)  # Shape: (numlines, points per line, x and y)
         """
@@ -71,26 +76,37 @@ class LineColormapBase:
         # ╭──────────────────────────────────────────────────────────╮
         # │ Create a set of line segments so that we can color them  │
         # │ individually                                             │
-        # │ This creates the points as an N x 1 x 2 array so that    │
-        # │ we can stack points                                      │
-        # │ together easily to get the segments. The segments array  │
-        # │ for line collection                                      │
-        # │ needs to be (numlines) x (points per line) x 2 (for x    │
-        # │ and y)                                                   │
+        # │ The segments array for line collection needs to be       │
+        # │ (numlines) x (points per line) x 2 (for x and y). The    │
+        # │ points are stored once as (x, y) pairs and the segments  │
+        # │ are overlapping windows of two consecutive points        │
         # ╰──────────────────────────────────────────────────────────╯
-        points = np.array([x, y], dtype=np.float64).T.reshape(-1, 1, 2)
-        segments: NDArray[np.float64] = np.concatenate(
-            [points[:-1], points[1:]], axis=1
-        )
+        xdata = np.asarray(x, dtype=np.float64)
+        ydata = np.asarray(y, dtype=np.float64)
+
+        if xdata.size < 2:
+            return np.empty((0, 2, 2), dtype=np.float64)
+
+        points: NDArray[np.float64] = np.empty((xdata.size, 2), dtype=np.float64)
+        points[:, 0] = xdata
+        points[:, 1] = ydata
+
+        # windows are taken along the points, giving (numlines, x and y, points per
+        # line), so the last two axes are swapped
+        segments: NDArray[np.float64] = sliding_window_view(
+            points, 2, axis=0
+        ).swapaxes(1, 2)
         return segments
 
-    def _create_cmap(self, cmapdata: NDArray[Any]) -> Normalize:
+    @staticmethod
+    def _create_cmap(cmapdata: NDArray[Any]) -> Normalize:
         """
         Creates a normalization object for mapping data points to colors.
 
         This method generates a `Normalize` object from Matplotlib, which scales
         input data to the range `[0, 1]` for use in colormaps. If the input data has
         at least two elements, the maximum value is removed to prevent color saturation.
+        Constant data is mapped with equal minimum and maximum.
 
         Parameters
         --------------------
@@ -105,16 +121,135 @@ class LineColormapBase:
         Examples
         --------------------
         >>> cmapdata = np.array([0.1, 0.4, 0.6, 0.9])
-        >>> line_base = LineColormapBase()
-        >>> norm = line_base._create_cmap(cmapdata)
+        >>> norm = LineColormapBase._create_cmap(cmapdata)
         >>> print(norm(cmapdata))
         [0.   0.5  0.83333333 1.  ]  # Normalized data
         """
 
         # Create a continuous norm to map from data points to colors
+        vmin = np.min(cmapdata)
+        vmax = np.max(cmapdata)
         if len(cmapdata) >= 2:
-            # delete maximun data
-            cmapdata = np.delete(cmapdata, np.where(cmapdata == np.max(cmapdata)))
-        norm = Normalize(cmapdata.min(), cmapdata.max())
+            # the largest value below the maximum, reduced in place without a filtered
+            # copy; constant data keeps its single value
+            vmax = np.max(cmapdata, where=cmapdata != vmax, initial=vmin)
+        norm = Normalize(vmin, vmax)
 
         return norm
+
+    @staticmethod
+    def _interpolate(
+        cumulative_distances: NDArray[Any],
+        interpolated_distances: NDArray[Any],
+        *data: NDArray[Any],
+    ) -> tuple[NDArray[Any], ...]:
+        """
+        Linearly interpolates several data arrays at the same distances.
+
+        This is equivalent to calling `np.interp` for each array, but the interval
+        search and the interpolation weights are computed once and shared by all arrays.
+
+        Parameters
+        --------------------
+        cumulative_distances : numpy.ndarray
+            The non-decreasing cumulative distances of the data points.
+        interpolated_distances : numpy.ndarray
+            The distances at which to interpolate.
+        *data : numpy.ndarray
+            The data arrays sampled at `cumulative_distances`.
+
+        Returns
+        --------------------
+        tuple of numpy.ndarray
+            The interpolated data arrays, in the order they were given.
+
+        Examples
+        --------------------
+        >>> cumulative_distances = np.array([0.0, 1.0, 3.0])
+        >>> interpolated_distances = np.array([0.5, 2.0])
+        >>> LineColormapBase._interpolate(
+        ...     cumulative_distances, interpolated_distances, np.array([0, 2, 6])
+        ... )
+        (array([1., 4.]),)
+        """
+        idx = np.searchsorted(cumulative_distances, interpolated_distances, "right")
+        np.clip(idx, 1, len(cumulative_distances) - 1, out=idx)
+        lower_distances = cumulative_distances[idx - 1]
+        steps = cumulative_distances[idx] - lower_distances
+        # a zero-length step only remains where the index was clipped to the last
+        # point, i.e. at the end of repeated trailing points, which takes the last value
+        weights = np.divide(
+            interpolated_distances - lower_distances,
+            steps,
+            out=np.ones_like(steps),
+            where=steps != 0,
+        )
+
+        return tuple(
+            values[idx - 1] + weights * (values[idx] - values[idx - 1])
+            for values in data
+        )
+
+    @staticmethod
+    def _interpolate_points(
+        x: NDArray[Any],
+        y: NDArray[Any],
+        cmapdata: NDArray[Any],
+        interpolation_points: int,
+    ) -> tuple[NDArray[Any], ...]:
+        """
+        Resamples a line and its colormap data at evenly spaced arc lengths.
+
+        Parameters
+        --------------------
+        x : numpy.ndarray
+            The x-coordinates of the line.
+        y : numpy.ndarray
+            The y-coordinates of the line.
+        cmapdata : numpy.ndarray
+            The colormap data of the line.
+        interpolation_points : int
+            The number of points to interpolate.
+
+        Returns
+        --------------------
+        tuple of numpy.ndarray
+            The interpolated x-coordinates, y-coordinates, and colormap data.
+
+        Examples
+        --------------------
+        >>> x = np.array([0.0, 1.0, 2.0])
+        >>> y = np.array([0.0, 0.0, 0.0])
+        >>> cmapdata = np.array([0.0, 1.0, 2.0])
+        >>> LineColormapBase._interpolate_points(x, y, cmapdata, 5)
+        (array([0. , 0.5, 1. , 1.5, 2. ]), array([0., 0., 0., 0., 0.]), array([0. , 0.5, 1. , 1.5, 2. ]))
+        """
+        distances = np.hypot(np.diff(x), np.diff(y))
+        # accumulate directly behind a leading zero instead of inserting it afterwards
+        cumulative_distances = np.empty(distances.size + 1, dtype=np.float64)
+        cumulative_distances[0] = 0.0
+        np.cumsum(distances, out=cumulative_distances[1:])
+        interpolated_distances = np.linspace(
+            0, cumulative_distances[-1], interpolation_points
+        )
+
+        # a constant colormap stays constant, so only x and y need interpolating
+        # The end points are compared first, so varying data rarely takes a full pass
+        if (
+            cmapdata.size
+            and cmapdata[0] == cmapdata[-1]
+            and (cmapdata == cmapdata[0]).all()
+        ):
+            x_interpolated, y_interpolated = LineColormapBase._interpolate(
+                cumulative_distances, interpolated_distances, x, y
+            )
+            return (
+                x_interpolated,
+                y_interpolated,
+                np.full(interpolation_points, cmapdata[0], dtype=np.float64),
+            )
+
+        # x, y and cmapdata share one interval search and one set of weights
+        return LineColormapBase._interpolate(
+            cumulative_distances, interpolated_distances, x, y, cmapdata
+        )
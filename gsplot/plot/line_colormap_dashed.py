@@ -1,4 +1,5 @@
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping, Sequence, cast
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -15,8 +16,14 @@ from .line_colormap_base import LineColormapBase
 
 __all__: list[str] = ["line_colormap_dashed"]
 
+_ALIAS_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "lw": "linewidth",
+    }
+)
 
-class LineColormapDashed:
+
+class LineColormapDashed(LineColormapBase):
     """
     A class for creating and plotting dashed lines with colormap interpolation.
 
@@ -71,7 +78,7 @@ class LineColormapDashed:
     >>> dashed_line = LineColormapDashed(0, x, y, cmapdata, line_pattern=(5, 5))
     >>> lc_list = dashed_line.plot()
     >>> print(len(lc_list))
-    10  # Number of dashed line segments
+    2  # Completed dashes and the open trailing dash
     """
 
     def __init__(
@@ -91,9 +98,6 @@ class LineColormapDashed:
 
         self.ax: Axes = ax
 
-        self._x: ArrayLike = x
-        self._y: ArrayLike = y
-        self._cmapdata: ArrayLike = cmapdata
         self.cmap: str = cmap
         self.linewidth = linewidth
         self.line_pattern: tuple[int | float, int | float] = line_pattern
@@ -102,26 +106,26 @@ class LineColormapDashed:
         self._yspan: int | float | None = yspan
         self.kwargs: Any = kwargs
 
-        self.x: NDArray[Any] = np.array(self._x)
-        self.y: NDArray[Any] = np.array(self._y)
-        self.cmapdata: NDArray[Any] = np.array(self._cmapdata)
+        self.x: NDArray[Any] = np.ascontiguousarray(x, dtype=np.float64)
+        self.y: NDArray[Any] = np.ascontiguousarray(y, dtype=np.float64)
+        self.cmapdata: NDArray[Any] = np.ascontiguousarray(cmapdata, dtype=np.float64)
 
         if self.label is not None:
             self.add_legend_colormap()
 
-        self.xspan: float = (
-            self.get_data_span()[0] if self._xspan is None else self._xspan
-        )
-        self.yspan: float = (
-            self.get_data_span()[1] if self._yspan is None else self._yspan
-        )
+        # the data span is computed once, and only if a span is not given
+        xspan, yspan = self._xspan, self._yspan
+        if xspan is None or yspan is None:
+            data_span = self.get_data_span()
+            xspan = data_span[0] if xspan is None else xspan
+            yspan = data_span[1] if yspan is None else yspan
+        self.xspan: float = xspan
+        self.yspan: float = yspan
 
         self.fig = plt.gcf()
 
         self.verify_line_pattern()
 
-        self._calculate_uniform_coordinates()
-
     def add_legend_colormap(self) -> None:
         """
         Adds a legend entry for the colormap associated with the dashed line.
@@ -211,10 +215,8 @@ class LineColormapDashed:
         array([2.0, 2.0])
         """
 
-        xmax, xmin = np.max(self.x), np.min(self.x)
-        ymax, ymin = np.max(self.y), np.min(self.y)
-        xspan = xmax - xmin
-        yspan = ymax - ymin
+        xspan = np.ptp(self.x)
+        yspan = np.ptp(self.y)
         return np.array([xspan, yspan])
 
     def get_scales(self) -> tuple[float, float]:
@@ -278,31 +280,18 @@ class LineColormapDashed:
         >>> line = LineColormapDashed(ax=ax, x=[0, 1, 2], y=[1, 2, 3], cmapdata=[0.1, 0.5, 1.0])
         >>> x_interp, y_interp, cmap_interp = line.get_interpolated_data(100)
         """
-
-        xdiff = np.diff(self.x)
-        ydiff = np.diff(self.y)
-        distances = np.sqrt(xdiff**2 + ydiff**2)
-        cumulative_distances = np.insert(np.cumsum(distances), 0, 0)
-        interpolated_distances = np.linspace(
-            0, cumulative_distances[-1], interpolation_points
-        )
-
-        x_interpolated = np.interp(interpolated_distances, cumulative_distances, self.x)
-        y_interpolated = np.interp(interpolated_distances, cumulative_distances, self.y)
-
-        # Interpolate cmapdata
-        cmap_interpolated = np.interp(
-            interpolated_distances, cumulative_distances, self.cmapdata
+        return self._interpolate_points(
+            self.x, self.y, self.cmapdata, interpolation_points
         )
 
-        return x_interpolated, y_interpolated, cmap_interpolated
-
     def _calculate_uniform_coordinates(self) -> None:
         """
         Interpolates the x, y, and colormap data to ensure uniform dash spacing.
 
         This method calculates evenly spaced points along the input x and y data
         and interpolates the colormap data accordingly.
+        Data whose steps are all shorter than the interpolation step is used
+        without interpolation.
 
         Parameters
         --------------------
@@ -324,13 +313,11 @@ class LineColormapDashed:
         self.scaled_x = self.x * xscale
         self.scaled_y = self.y * yscale
 
-        self.scaled_xdiff = np.diff(self.scaled_x)
-        self.scaled_ydiff = np.diff(self.scaled_y)
-
-        self.scaled_xdiff = np.nan_to_num(np.diff(self.scaled_x), nan=0.0)
-        self.scaled_ydiff = np.nan_to_num(np.diff(self.scaled_y), nan=0.0)
+        # each difference is taken once and its NaNs are zeroed in place
+        self.scaled_xdiff = np.nan_to_num(np.diff(self.scaled_x), copy=False, nan=0.0)
+        self.scaled_ydiff = np.nan_to_num(np.diff(self.scaled_y), copy=False, nan=0.0)
 
-        self.scaled_distances = np.sqrt(self.scaled_xdiff**2 + self.scaled_ydiff**2)
+        self.scaled_distances = np.hypot(self.scaled_xdiff, self.scaled_ydiff)
         self.scaled_total_distances = np.sum(self.scaled_distances)
 
         FACTOR = 5
@@ -338,24 +325,95 @@ class LineColormapDashed:
             self.scaled_total_distances * FACTOR // self.length_solid
         )
 
-        self.x_interpolated, self.y_interpolated, self.cmap_interpolated = (
-            self.get_interpolated_data(INTERPOLATION_POINTS)
-        )
+        # Data whose every step is already shorter than the interpolation step
+        # resolves the dashes at least as finely, so it is used as it is
+        if (
+            INTERPOLATION_POINTS >= 2
+            and self.scaled_distances.size
+            and self.scaled_distances.max()
+            <= self.scaled_total_distances / (INTERPOLATION_POINTS - 1)
+        ):
+            self.x_interpolated, self.y_interpolated, self.cmap_interpolated = (
+                self.x,
+                self.y,
+                self.cmapdata,
+            )
+        else:
+            self.x_interpolated, self.y_interpolated, self.cmap_interpolated = (
+                self.get_interpolated_data(INTERPOLATION_POINTS)
+            )
 
-        self.scaled_inter_xdiff = np.gradient(self.x_interpolated * xscale)
-        self.scaled_inter_ydiff = np.gradient(self.y_interpolated * yscale)
-        self.scaled_inter_distances = np.sqrt(
-            self.scaled_inter_xdiff**2 + self.scaled_inter_ydiff**2
+        # forward differences: the distance from each interpolated point to the next
+        # The differences are scaled in place instead of scaling full copies of the
+        # interpolated coordinates first
+        self.scaled_inter_xdiff = np.diff(self.x_interpolated)
+        self.scaled_inter_xdiff *= xscale
+        self.scaled_inter_ydiff = np.diff(self.y_interpolated)
+        self.scaled_inter_ydiff *= yscale
+        self.scaled_inter_distances = np.hypot(
+            self.scaled_inter_xdiff, self.scaled_inter_ydiff
         )
 
+    def _get_dash_bounds(self) -> tuple[list[tuple[int, int]], int | None]:
+        """
+        Finds the index ranges of the dashes along the interpolated coordinates.
+
+        Instead of accumulating the distance point by point, the cumulative distance
+        is searched once per dash and once per gap for the index where the solid or
+        gap length is reached.
+
+        Returns
+        --------------------
+        tuple[list[tuple[int, int]], int or None]
+            The `(start, stop)` slice bounds of the completed dashes, and the start
+            index of the trailing dash that is still open at the end of the line
+            (None if the line ends in a gap).
+
+        Examples
+        --------------------
+        >>> line = LineColormapDashed(ax=ax, x=[0, 1, 2], y=[1, 2, 3], cmapdata=[0.1, 0.5, 1.0])
+        >>> dash_bounds, idx_tail = line._get_dash_bounds()
+        """
+        # cumulative distance up to each point that can close a dash or a gap
+        cumulative_distances = np.cumsum(self.scaled_inter_distances)
+        num_points = len(cumulative_distances)
+
+        dash_bounds: list[tuple[int, int]] = []
+        draw_dash = True
+        idx_start = 0
+        # distances are accumulated from the point after the last switch
+        idx_min = 0
+        base_length = 0.0
+        while num_points > 0:
+            length = self.length_solid if draw_dash else self.length_gap
+            # the first index at which the accumulated distance reaches the length
+            idx_end = max(
+                int(np.searchsorted(cumulative_distances, base_length + length)),
+                idx_min,
+            )
+            if idx_end >= num_points:
+                break
+
+            if draw_dash:
+                dash_bounds.append((idx_start, idx_end + 1))
+
+            draw_dash = not draw_dash
+            idx_start = idx_end
+            idx_min = idx_end + 1
+            base_length = cumulative_distances[idx_end]
+
+        idx_tail = idx_start if draw_dash and num_points > 0 else None
+        return dash_bounds, idx_tail
+
     @AxesRangeSingleton.update
     def plot(self) -> list[LineCollection]:
         """
         Plots the dashed line with a colormap applied to individual segments.
 
-        This method creates dashed line segments by iterating over the interpolated
-        coordinates and adding `LineCollection` objects to the target axis. Each
-        dash segment is colored based on the provided colormap data.
+        This method creates dashed line segments from the dash bounds found along the
+        interpolated coordinates. All completed dashes are added to the target axis as a
+        single `LineCollection`, and a dash left open at the end of the line is added as a
+        second one. Each dash segment is colored based on the provided colormap data.
 
         Parameters
         --------------------
@@ -364,7 +422,8 @@ class LineColormapDashed:
         Returns
         --------------------
         list[matplotlib.collections.LineCollection]
-            A list of `LineCollection` objects representing the plotted dashed line segments.
+            A list of at most two `LineCollection` objects representing the plotted dashed
+            line segments.
 
         Notes
         --------------------
@@ -372,6 +431,8 @@ class LineColormapDashed:
         singleton with the plotted data.
         - The method uses `LineColormapBase` for creating line segments and normalizing the
         colormap data.
+        - The uniform coordinates are calculated here rather than on construction, so the
+        axis size is read only when the line is plotted.
 
         Raises
         --------------------
@@ -386,64 +447,58 @@ class LineColormapDashed:
         >>> line = LineColormapDashed(ax=ax, x=x, y=y, cmapdata=cmapdata)
         >>> lc_list = line.plot()
         """
-        current_length = 0
-        draw_dash = True
-        idx_start = 0
+        # the axis geometry is only queried when the line is actually plotted
+        self._calculate_uniform_coordinates()
+
+        norm = LineColormapBase._create_cmap(self.cmapdata)
 
-        norm = LineColormapBase()._create_cmap(self.cmapdata)
+        dash_bounds, idx_tail = self._get_dash_bounds()
+
+        # segments between all consecutive interpolated points, each colored by its
+        # starting point
+        segments = LineColormapBase._create_segment(
+            self.x_interpolated, self.y_interpolated
+        )
+        cmap_segments = self.cmap_interpolated[:-1]
 
         lc_list: list[LineCollection] = []
-        for i in range(len(self.x_interpolated) - 1):
-            current_length += self.scaled_inter_distances[i]
+        if dash_bounds:
+            # mark the segments covered by the completed dashes
+            bounds = np.array(dash_bounds)
+            coverage = np.zeros(len(segments) + 1, dtype=np.int64)
+            coverage[bounds[:, 0]] += 1
+            coverage[bounds[:, 1] - 1] -= 1
+            is_dash = np.cumsum(coverage[:-1]) > 0
+
+            # all completed dashes share one collection, built from the segment array
+            lc = LineCollection(
+                cast(Sequence[ArrayLike], segments[is_dash]),
+                cmap=self.cmap,
+                norm=norm,
+                capstyle="projecting",
+            )
+            lc.set_array(cmap_segments[is_dash])
+            lc.set_linewidth(self.linewidth)
+            lc.set_linestyle("solid")
+            self.ax.add_collection(lc)
+
+            lc_list.append(lc)
+
+        # at last with the last point if the line ends within a dash, without
+        # projecting beyond the end of the data
+        if idx_tail is not None:
+            lc = LineCollection(
+                cast(Sequence[ArrayLike], segments[idx_tail:]),
+                cmap=self.cmap,
+                norm=norm,
+            )
+            lc.set_array(cmap_segments[idx_tail:])
+            lc.set_linewidth(self.linewidth)
+            lc.set_linestyle("solid")
 
-            if draw_dash:
-                if current_length >= self.length_solid:
-                    segments = LineColormapBase()._create_segment(
-                        self.x_interpolated[idx_start : i + 1],
-                        self.y_interpolated[idx_start : i + 1],
-                    )
-
-                    lc = LineCollection(
-                        segments.tolist(),
-                        cmap=self.cmap,
-                        norm=norm,
-                        capstyle="projecting",
-                    )
-                    lc.set_array(self.cmap_interpolated[idx_start : i + 1])
-                    lc.set_linewidth(self.linewidth)
-                    lc.set_linestyle("solid")
-                    self.ax.add_collection(lc)
-
-                    lc_list.append(lc)
-
-                    draw_dash = False
-                    current_length = 0
-                    idx_start = i
-            else:
-                if current_length >= self.length_gap:
-                    draw_dash = True
-                    current_length = 0
-                    idx_start = i
-
-            # at last with the last point if draw_dash is True
-            if i == len(self.x_interpolated) - 2 and draw_dash:
-                segments = LineColormapBase()._create_segment(
-                    self.x_interpolated[idx_start:],
-                    self.y_interpolated[idx_start:],
-                )
-
-                lc = LineCollection(
-                    segments.tolist(),
-                    cmap=self.cmap,
-                    norm=norm,
-                )
-                lc.set_array(self.cmap_interpolated[idx_start:])
-                lc.set_linewidth(self.linewidth)
-                lc.set_linestyle("solid")
-
-                self.ax.add_collection(lc)
-
-                lc_list.append(lc)
+            self.ax.add_collection(lc)
+
+            lc_list.append(lc)
 
         return lc_list
 
@@ -513,12 +568,8 @@ def line_colormap_dashed(
     >>> cmapdata = [0.1, 0.4, 0.6, 0.9]
     >>> line_collections = gs.line_colormap_dashed(ax, x, y, cmapdata, line_pattern=(5, 5))
     """
-    alias_map = {
-        "lw": "linewidth",
-    }
-
     passed_params: dict[str, Any] = ParamsGetter("passed_params").get_bound_params()
-    AliasValidator(alias_map, passed_params).validate()
+    AliasValidator(_ALIAS_MAP, passed_params).validate()
     class_params = CreateClassParams(passed_params).get_class_params()
 
     _line_colormap_dashed: LineColormapDashed = LineColormapDashed(
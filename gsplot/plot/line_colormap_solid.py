@@ -1,4 +1,5 @@
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping, Sequence, cast
 
 import numpy as np
 from matplotlib.axes import Axes
@@ -14,8 +15,14 @@ from .line_colormap_base import LineColormapBase
 
 __all__: list[str] = ["line_colormap_solid"]
 
+_ALIAS_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "lw": "linewidth",
+    }
+)
+
 
-class LineColormapSolid:
+class LineColormapSolid(LineColormapBase):
     """
     A class for plotting solid lines with a colormap applied along the line segments.
 
@@ -84,9 +91,6 @@ class LineColormapSolid:
         **kwargs: Any,
     ) -> None:
         self.ax: Axes = ax
-        self._x: ArrayLike = x
-        self._y: ArrayLike = y
-        self._cmapdata: ArrayLike = cmapdata
         self.cmap: str = cmap
         self.linewidth = linewidth
         self.label: str | None = label
@@ -94,9 +98,9 @@ class LineColormapSolid:
 
         self.kwargs: Any = kwargs
 
-        self.x: NDArray[Any] = np.array(self._x)
-        self.y: NDArray[Any] = np.array(self._y)
-        self.cmapdata: NDArray[Any] = np.array(self._cmapdata)
+        self.x: NDArray[Any] = np.ascontiguousarray(x, dtype=np.float64)
+        self.y: NDArray[Any] = np.ascontiguousarray(y, dtype=np.float64)
+        self.cmapdata: NDArray[Any] = np.ascontiguousarray(cmapdata, dtype=np.float64)
 
         if self.label is not None:
             self.add_legend_colormap()
@@ -138,24 +142,10 @@ class LineColormapSolid:
         tuple
             Interpolated x-coordinates, y-coordinates, and colormap data.
         """
-        xdiff = np.diff(self.x)
-        ydiff = np.diff(self.y)
-        distances = np.sqrt(xdiff**2 + ydiff**2)
-        cumulative_distances = np.insert(np.cumsum(distances), 0, 0)
-        interpolated_distances = np.linspace(
-            0, cumulative_distances[-1], interpolation_points
-        )
-
-        x_interpolated = np.interp(interpolated_distances, cumulative_distances, self.x)
-        y_interpolated = np.interp(interpolated_distances, cumulative_distances, self.y)
-
-        # Interpolate cmapdata
-        cmap_interpolated = np.interp(
-            interpolated_distances, cumulative_distances, self.cmapdata
+        return self._interpolate_points(
+            self.x, self.y, self.cmapdata, interpolation_points
         )
 
-        return x_interpolated, y_interpolated, cmap_interpolated
-
     @AxesRangeSingleton.update
     def plot(self) -> list[LineCollection]:
         """
@@ -178,13 +168,14 @@ class LineColormapSolid:
             self.x, self.y, self.cmapdata = self.normal_interpolate_points(
                 self.interpolation_points
             )
-        segments: NDArray[np.float64] = LineColormapBase()._create_segment(
+        segments: NDArray[np.float64] = LineColormapBase._create_segment(
             self.x, self.y
         )
-        norm = LineColormapBase()._create_cmap(self.cmapdata)
+        norm = LineColormapBase._create_cmap(self.cmapdata)
 
+        # LineCollection accepts the (N, 2, 2) array directly, without a nested list
         lc: LineCollection = LineCollection(
-            segments.tolist(), cmap=self.cmap, norm=norm
+            cast(Sequence[ArrayLike], segments), cmap=self.cmap, norm=norm
         )
         lc.set_array(self.cmapdata)
         lc.set_linewidth(self.linewidth)
@@ -258,12 +249,8 @@ def line_colormap_solid(
     1
     """
 
-    alias_map = {
-        "lw": "linewidth",
-    }
-
     passed_params: dict[str, Any] = ParamsGetter("passed_params").get_bound_params()
-    AliasValidator(alias_map, passed_params).validate()
+    AliasValidator(_ALIAS_MAP, passed_params).validate()
     class_params = CreateClassParams(passed_params).get_class_params()
 
     _line_colormap_solid: LineColormapSolid = LineColormapSolid(
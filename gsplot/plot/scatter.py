@@ -1,7 +1,7 @@
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 import numpy as np
-from matplotlib import colors
 from matplotlib.axes import Axes
 from matplotlib.collections import PathCollection
 from matplotlib.typing import ColorType
@@ -14,6 +14,12 @@ from .line_base import AutoColor, NumLines
 
 __all__: list[str] = ["scatter"]
 
+_ALIAS_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "s": "size",
+    }
+)
+
 
 class Scatter:
     """
@@ -77,8 +83,9 @@ class Scatter:
         self.alpha: int | float = alpha
         self.kwargs: Any = kwargs
 
-        self.x: NDArray[Any] = np.array(self._x)
-        self.y: NDArray[Any] = np.array(self._y)
+        # arrays are only copied when they are not already ndarrays
+        self.x: NDArray[Any] = np.asarray(self._x)
+        self.y: NDArray[Any] = np.asarray(self._y)
 
         self.color = self.get_color()
 
@@ -104,13 +111,11 @@ class Scatter:
         >>> scatter = Scatter(ax=ax, x=[1, 2], y=[3, 4])
         >>> scatter.get_color()
         """
-        cycle_color: NDArray | str = AutoColor(self.ax).get_color()
-        if isinstance(cycle_color, np.ndarray):
-            cycle_color = colors.to_hex(
-                tuple(cycle_color)
-            )  # convert numpy array to tuple
+        if self._color is not None:
+            return self._color
 
-        default_color: ColorType = cycle_color if self._color is None else self._color
+        # the cycle colors are converted to hexadecimal strings once and cached
+        default_color: ColorType = AutoColor.get_cycle_color_hex(self.ax)
         return default_color
 
     @NumLines.count
@@ -201,12 +206,8 @@ def scatter(
     >>> gs.scatter(ax=ax, x=x, y=y, color="red", size=20, alpha=0.8)
     <matplotlib.collections.PathCollection>
     """
-    alias_map = {
-        "s": "size",
-    }
-
     passed_params: dict[str, Any] = ParamsGetter("passed_params").get_bound_params()
-    AliasValidator(alias_map, passed_params).validate()
+    AliasValidator(_ALIAS_MAP, passed_params).validate()
     class_params: dict[str, Any] = CreateClassParams(passed_params).get_class_params()
 
     _scatter = Scatter(
@@ -1,4 +1,5 @@
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 import numpy as np
 from matplotlib.axes import Axes
@@ -12,6 +13,12 @@ from ..style.legend_colormap import LegendColormap
 
 __all__: list[str] = ["scatter_colormap"]
 
+_ALIAS_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "s": "size",
+    }
+)
+
 
 class ScatterColormap:
     """
@@ -101,9 +108,10 @@ class ScatterColormap:
         self.label: str | None = label
         self.kwargs: Any = kwargs
 
-        self.x: NDArray[Any] = np.array(self._x)
-        self.y: NDArray[Any] = np.array(self._y)
-        self.cmapdata: NDArray[Any] = np.array(self._cmapdata)
+        # arrays are only copied when they are not already ndarrays
+        self.x: NDArray[Any] = np.asarray(self._x)
+        self.y: NDArray[Any] = np.asarray(self._y)
+        self.cmapdata: NDArray[Any] = np.asarray(self._cmapdata, dtype=np.float64)
         self.vmin: float = float(self._vmin)
         self.vmax: float = float(self._vmax)
 
@@ -264,12 +272,8 @@ def scatter_colormap(
     >>> gs.scatter_colormap(ax=ax, x=x, y=y, cmapdata=cmapdata, cmap="plasma", label="Data")
     <matplotlib.collections.PathCollection>
     """
-    alias_map = {
-        "s": "size",
-    }
-
     passed_params: dict[str, Any] = ParamsGetter("passed_params").get_bound_params()
-    AliasValidator(alias_map, passed_params).validate()
+    AliasValidator(_ALIAS_MAP, passed_params).validate()
     class_params: dict[str, Any] = CreateClassParams(passed_params).get_class_params()
 
     _scatter_colormap = ScatterColormap(
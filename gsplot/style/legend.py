@@ -98,7 +98,6 @@ class Legend:
         handlers = {}
         for handle in handles:
             if type(handle) in handler_map:
-                print(handle)
                 handlers[handle] = handler_map[type(handle)]
             else:
                 # if handle is not in handler_map, pass
@@ -0,0 +1,17 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import pytest
+
+from gsplot.plot.line_base import NumLines
+
+
+@pytest.fixture
+def ax():
+    NumLines.reset()
+    fig, ax = plt.subplots()
+    yield ax
+    plt.close(fig)
+    NumLines.reset()
@@ -0,0 +1,101 @@
+import matplotlib
+import numpy as np
+import pytest
+from matplotlib import colors
+
+from gsplot.config.config import Config
+from gsplot.plot.line import LineBatch, line, line_batch
+from gsplot.plot.line_base import AutoColor, NumLines
+
+
+class TestLine:
+    def test_nth_color_follows_prop_cycle(self, ax):
+        (before,) = line(ax, [0, 1], [0, 1], color="C0")
+
+        with matplotlib.rc_context(
+            {"axes.prop_cycle": matplotlib.cycler(color=["red", "green"])}
+        ):
+            (after,) = line(ax, [0, 1], [0, 1], color="C0")
+
+        assert before.get_color() == colors.to_rgba("#1f77b4")
+        assert after.get_color() == (1.0, 0.0, 0.0, 1.0)
+        assert after.get_markerfacecolor() == (1.0, 0.0, 0.0, 0.2)
+
+
+class TestLineBatch:
+    def test_shared_x(self, ax):
+        x = np.linspace(0, 1, 5)
+        y = np.vstack([x, x**2, x**3])
+
+        lines = line_batch(ax, x, y)
+
+        assert len(lines) == 3
+        for line2d, y_line in zip(lines, y):
+            assert np.array_equal(line2d.get_xdata(), x)
+            assert np.array_equal(line2d.get_ydata(), y_line)
+
+    def test_per_line_x(self, ax):
+        x = np.array([[0, 1, 2], [3, 4, 5]])
+        y = np.array([[0, 1, 0], [1, 0, 1]])
+
+        lines = line_batch(ax, x, y, color="red")
+
+        assert len(lines) == 2
+        for line2d, x_line, y_line in zip(lines, x, y):
+            assert np.array_equal(line2d.get_xdata(), x_line)
+            assert np.array_equal(line2d.get_ydata(), y_line)
+
+    def test_explicit_color(self, ax):
+        lines = line_batch(ax, [0, 1], [[0, 1], [1, 0]], color="red", alpha=0.5)
+
+        for line2d in lines:
+            assert line2d.get_color() == (1.0, 0.0, 0.0, 0.5)
+            assert line2d.get_markerfacecolor() == (1.0, 0.0, 0.0, 0.1)
+
+    def test_auto_color(self, ax):
+        colormap_hex = AutoColor.get_colormap_hex(
+            AutoColor.CMAP, AutoColor.COLORMAP_LENGTH
+        )
+        NumLines().increment(ax, 2)
+
+        lines = line_batch(ax, [0, 1], [[0, 1], [1, 0], [2, 2]], mec="black")
+
+        for i, line2d in enumerate(lines):
+            expected = colors.to_rgba(colormap_hex[(2 + i) % len(colormap_hex)])
+            assert line2d.get_color() == expected
+            assert line2d.get_markeredgecolor() == (0.0, 0.0, 0.0, 1.0)
+
+    def test_num_lines_advance(self, ax):
+        line_batch(ax, [0, 1], [[0, 1], [1, 0], [2, 2]])
+        assert NumLines().num_lines(ax) == 3
+
+        line_batch(ax, [0, 1], [[0, 1], [1, 0]], color="red")
+        assert NumLines().num_lines(ax) == 5
+
+    def test_alias(self, ax):
+        lines = line_batch(ax, [0, 1], [[0, 1], [1, 0]], lw=3, ms=2)
+
+        for line2d in lines:
+            assert line2d.get_linewidth() == 3
+            assert line2d.get_markersize() == 2
+
+    def test_config_entry(self, ax, monkeypatch):
+        monkeypatch.setitem(Config().config_dict, "line_batch", {"linewidth": 4})
+
+        lines = line_batch(ax, [0, 1], [[0, 1], [1, 0]])
+
+        for line2d in lines:
+            assert line2d.get_linewidth() == 4
+
+    def test_label_on_first_line(self, ax):
+        lines = line_batch(ax, [0, 1], [[0, 1], [1, 0]], label="batch")
+
+        assert lines[0].get_label() == "batch"
+        assert lines[1].get_label() != "batch"
+
+    def test_invalid_shape(self, ax):
+        with pytest.raises(ValueError):
+            LineBatch(ax, [0, 1], [0, 1])
+
+        with pytest.raises(ValueError):
+            LineBatch(ax, [0, 1, 2], [[0, 1], [1, 0]])
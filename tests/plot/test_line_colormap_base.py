@@ -0,0 +1,137 @@
+import numpy as np
+import pytest
+
+from gsplot.plot.line_colormap_base import LineColormapBase
+
+
+class TestLineColormapBase:
+    @pytest.mark.parametrize(
+        "cumulative_distances",
+        [
+            np.array([0.0, 1.0, 3.0, 4.5]),
+            # repeated points in the middle
+            np.array([0.0, 1.0, 1.0, 2.0, 3.0]),
+            # repeated leading points
+            np.array([0.0, 0.0, 1.0, 2.0]),
+            # repeated trailing points
+            np.array([0.0, 1.0, 1.0]),
+            np.array([0.0, 1.0, 2.0, 2.0, 2.0]),
+            # a single point
+            np.array([0.0]),
+        ],
+    )
+    def test_interpolate_matches_np_interp(self, cumulative_distances):
+        rng = np.random.default_rng(0)
+        values = rng.random(len(cumulative_distances))
+        other_values = rng.random(len(cumulative_distances))
+        interpolated_distances = np.concatenate(
+            [
+                np.linspace(0, cumulative_distances[-1], 17),
+                cumulative_distances,
+            ]
+        )
+
+        interpolated, other_interpolated = LineColormapBase._interpolate(
+            cumulative_distances, interpolated_distances, values, other_values
+        )
+
+        assert np.allclose(
+            interpolated,
+            np.interp(interpolated_distances, cumulative_distances, values),
+        )
+        assert np.allclose(
+            other_interpolated,
+            np.interp(interpolated_distances, cumulative_distances, other_values),
+        )
+
+    def test_interpolate_points(self):
+        x = np.array([0.0, 1.0, 2.0])
+        y = np.array([0.0, 0.0, 0.0])
+        cmapdata = np.array([0.0, 1.0, 2.0])
+
+        x_interpolated, y_interpolated, cmap_interpolated = (
+            LineColormapBase._interpolate_points(x, y, cmapdata, 5)
+        )
+
+        assert np.allclose(x_interpolated, [0.0, 0.5, 1.0, 1.5, 2.0])
+        assert np.allclose(y_interpolated, 0.0)
+        assert np.allclose(cmap_interpolated, [0.0, 0.5, 1.0, 1.5, 2.0])
+
+    @pytest.mark.parametrize(
+        "cmapdata",
+        [
+            np.array([2.0, 2.0, 2.0, 2.0]),
+            # equal end points around varying data
+            np.array([2.0, 5.0, 1.0, 2.0]),
+        ],
+    )
+    def test_interpolate_points_matches_np_interp(self, cmapdata):
+        x = np.array([0.0, 1.0, 3.0, 4.0])
+        y = np.array([0.0, 1.0, 1.0, 0.0])
+
+        x_interpolated, y_interpolated, cmap_interpolated = (
+            LineColormapBase._interpolate_points(x, y, cmapdata, 9)
+        )
+
+        distances = np.concatenate(
+            [[0.0], np.cumsum(np.hypot(np.diff(x), np.diff(y)))]
+        )
+        samples = np.linspace(0, distances[-1], 9)
+        assert np.allclose(x_interpolated, np.interp(samples, distances, x))
+        assert np.allclose(y_interpolated, np.interp(samples, distances, y))
+        assert np.allclose(cmap_interpolated, np.interp(samples, distances, cmapdata))
+
+    def test_interpolate_points_repeated_end(self):
+        x = np.array([0.0, 1.0, 1.0])
+        y = np.array([0.0, 0.0, 0.0])
+        cmapdata = np.array([0.0, 10.0, 20.0])
+
+        _, _, cmap_interpolated = LineColormapBase._interpolate_points(
+            x, y, cmapdata, 3
+        )
+
+        assert cmap_interpolated[-1] == 20.0
+
+    def test_create_segment(self):
+        x = np.array([0.0, 1.0, 2.0, 3.0])
+        y = np.array([1.0, 3.0, 2.0, 5.0])
+
+        segments = LineColormapBase._create_segment(x, y)
+
+        points = np.array([x, y]).T.reshape(-1, 1, 2)
+        assert np.array_equal(
+            segments, np.concatenate([points[:-1], points[1:]], axis=1)
+        )
+        assert not segments.flags.writeable
+
+    @pytest.mark.parametrize("num_points", [0, 1])
+    def test_create_segment_too_few_points(self, num_points):
+        segments = LineColormapBase._create_segment(
+            np.zeros(num_points), np.zeros(num_points)
+        )
+
+        assert segments.shape == (0, 2, 2)
+
+    @pytest.mark.parametrize(
+        "cmapdata, vmin, vmax",
+        [
+            # the upper bound is the largest value below the maximum
+            (np.array([0.0, 1.0, 2.0, 3.0, 10.0]), 0.0, 3.0),
+            # every occurrence of the maximum is dropped
+            (np.array([0.0, 1.0, 5.0, 5.0]), 0.0, 1.0),
+            # constant data keeps its single value
+            (np.array([2.0, 2.0, 2.0]), 2.0, 2.0),
+            (np.array([2.0]), 2.0, 2.0),
+        ],
+    )
+    def test_create_cmap(self, cmapdata, vmin, vmax):
+        norm = LineColormapBase._create_cmap(cmapdata)
+
+        assert norm.vmin == vmin
+        assert norm.vmax == vmax
+
+    def test_create_cmap_nan(self):
+        norm = LineColormapBase._create_cmap(np.array([0.0, np.nan, 1.0]))
+
+        assert np.isnan(norm.vmin)
+        assert np.isnan(norm.vmax)
@@ -0,0 +1,201 @@
+import numpy as np
+import pytest
+
+from gsplot.plot.line_colormap_base import LineColormapBase
+from gsplot.plot.line_colormap_dashed import LineColormapDashed
+
+
+def _reference_dash_bounds(scaled_inter_distances, length_solid, length_gap):
+    # the per-point accumulator that LineColormapDashed.plot used to walk
+    current_length = 0.0
+    draw_dash = True
+    idx_start = 0
+    dash_bounds = []
+    for i, distance in enumerate(scaled_inter_distances):
+        current_length += distance
+        if draw_dash:
+            if current_length >= length_solid:
+                dash_bounds.append((idx_start, i + 1))
+                draw_dash = False
+                current_length = 0.0
+                idx_start = i
+        elif current_length >= length_gap:
+            draw_dash = True
+            current_length = 0.0
+            idx_start = i
+
+    has_points = len(scaled_inter_distances) > 0
+    idx_tail = idx_start if draw_dash and has_points else None
+    return dash_bounds, idx_tail
+
+
+def _reference_dash_segments(x, y, cmapdata, dash_bounds, idx_tail):
+    # one block of segments per dash, each segment colored by its starting point
+    def dash_segments(start, stop):
+        points = np.column_stack([x[start:stop], y[start:stop]])
+        return np.stack([points[:-1], points[1:]], axis=1), cmapdata[start : stop - 1]
+
+    collections = []
+    if dash_bounds:
+        dashes = [dash_segments(start, stop) for start, stop in dash_bounds]
+        collections.append(
+            (
+                np.concatenate([segments for segments, _ in dashes]),
+                np.concatenate([colors for _, colors in dashes]),
+            )
+        )
+    if idx_tail is not None:
+        collections.append(dash_segments(idx_tail, len(x)))
+    return collections
+
+
+_SAMPLE_LINES = [
+    (np.linspace(0, 10, 200), np.sin(np.linspace(0, 10, 200)), (5, 5), 1),
+    (np.linspace(0, 10, 50), np.sin(np.linspace(0, 10, 50)), (10, 10), 2),
+    (np.array([0, 1, 2, 3.0]), np.array([1, 3, 2, 5.0]), (10, 10), 1),
+    (
+        np.sort(np.random.default_rng(0).random(30)),
+        np.random.default_rng(1).random(30),
+        (3, 7),
+        0.5,
+    ),
+    (np.linspace(0, 1, 20), np.zeros(20), (8, 2), 1),
+]
+
+
+class TestDashBounds:
+    @pytest.mark.parametrize(
+        "scaled_inter_distances, line_pattern, linewidth, ends_in_dash",
+        [
+            # zero-length first dash
+            (np.ones(9), (0.5, 2), 1, True),
+            # ends in a gap
+            (np.ones(7), (2.5, 3), 1, False),
+            # ends in a dash
+            (np.ones(5), (2.5, 3), 1, True),
+            # uneven distances with repeated points
+            (
+                np.array([0, 1, 0, 0, 2, 0.5, 0.25, 3, 0, 1, 0.75, 0.25, 4]),
+                (1.5, 1),
+                1,
+                True,
+            ),
+            # no distances
+            (np.array([]), (10, 10), 1, False),
+        ],
+    )
+    def test_matches_reference(
+        self, ax, scaled_inter_distances, line_pattern, linewidth, ends_in_dash
+    ):
+        line = LineColormapDashed(
+            ax, [0, 1], [0, 1], [0, 1], linewidth=linewidth, line_pattern=line_pattern
+        )
+        line.scaled_inter_distances = scaled_inter_distances
+
+        dash_bounds, idx_tail = line._get_dash_bounds()
+
+        assert (dash_bounds, idx_tail) == _reference_dash_bounds(
+            scaled_inter_distances, line.length_solid, line.length_gap
+        )
+        assert (idx_tail is not None) == ends_in_dash
+
+    @pytest.mark.parametrize("x, y, line_pattern, linewidth", _SAMPLE_LINES)
+    def test_matches_reference_on_interpolated_data(
+        self, ax, x, y, line_pattern, linewidth
+    ):
+        line = LineColormapDashed(
+            ax, x, y, x, linewidth=linewidth, line_pattern=line_pattern
+        )
+        line._calculate_uniform_coordinates()
+
+        assert line._get_dash_bounds() == _reference_dash_bounds(
+            line.scaled_inter_distances, line.length_solid, line.length_gap
+        )
+
+
+class TestPlot:
+    def test_capstyle(self, ax):
+        x = np.linspace(0, 1, 20)
+        line = LineColormapDashed(ax, x, np.zeros(20), x, line_pattern=(8, 2))
+
+        lc_list = line.plot()
+
+        _, idx_tail = line._get_dash_bounds()
+        assert idx_tail is not None
+        assert len(lc_list) == 2
+        # completed dashes project their caps, the open trailing dash keeps butt caps
+        assert lc_list[0].get_capstyle() == "projecting"
+        assert lc_list[1].get_capstyle() in (None, "butt")
+
+    def test_ends_in_gap(self, ax):
+        x = np.linspace(0, 1, 20)
+        line = LineColormapDashed(ax, x, np.zeros(20), x, line_pattern=(10, 10))
+
+        lc_list = line.plot()
+
+        _, idx_tail = line._get_dash_bounds()
+        assert idx_tail is None
+        assert len(lc_list) == 1
+        assert lc_list[0].get_capstyle() == "projecting"
+
+    @pytest.mark.parametrize("x, y, line_pattern, linewidth", _SAMPLE_LINES)
+    def test_segments(self, ax, x, y, line_pattern, linewidth):
+        line = LineColormapDashed(
+            ax, x, y, x, linewidth=linewidth, line_pattern=line_pattern
+        )
+
+        lc_list = line.plot()
+
+        expected = _reference_dash_segments(
+            line.x_interpolated,
+            line.y_interpolated,
+            line.cmap_interpolated,
+            *line._get_dash_bounds(),
+        )
+        assert len(lc_list) == len(expected)
+        for lc, (segments, colors) in zip(lc_list, expected):
+            assert np.array_equal(np.asarray(lc.get_segments()), segments)
+            assert np.array_equal(lc.get_array(), colors)
+
+    def test_norm_follows_cmapdata(self, ax):
+        x = np.linspace(0, 1, 20)
+        cmapdata = np.linspace(0, 1, 20)
+        line = LineColormapDashed(ax, x, np.zeros(20), cmapdata)
+        line.plot()
+
+        line.cmapdata *= 10
+        lc_list = line.plot()
+
+        expected = LineColormapBase._create_cmap(line.cmapdata)
+        for lc in lc_list:
+            assert lc.norm.vmin == expected.vmin
+            assert lc.norm.vmax == expected.vmax
+
+
+class TestUniformCoordinates:
+    def test_dense_data_is_not_interpolated(self, ax):
+        x = np.linspace(0, 1, 2000)
+        line = LineColormapDashed(ax, x, np.zeros(2000), x)
+
+        line._calculate_uniform_coordinates()
+
+        assert line.x_interpolated is line.x
+        assert line.y_interpolated is line.y
+        assert line.cmap_interpolated is line.cmapdata
+
+    @pytest.mark.parametrize(
+        "x",
+        [
+            np.linspace(0, 1, 20),
+            # dense except for one large step
+            np.concatenate([np.linspace(0, 0.5, 2000), [1.0]]),
+        ],
+    )
+    def test_sparse_data_is_interpolated(self, ax, x):
+        line = LineColormapDashed(ax, x, np.zeros(len(x)), x)
+
+        line._calculate_uniform_coordinates()
+
+        assert line.x_interpolated is not line.x
+        steps = np.diff(line.x_interpolated)
+        assert np.allclose(steps, steps[0])
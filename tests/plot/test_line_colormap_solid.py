@@ -0,0 +1,27 @@
+import numpy as np
+
+from gsplot.plot.line_colormap_base import LineColormapBase
+from gsplot.plot.line_colormap_solid import LineColormapSolid
+
+
+class TestLineColormapSolid:
+    def test_norm_follows_interpolated_cmapdata(self, ax):
+        x = np.arange(5)
+        cmapdata = np.array([0, 1, 2, 3, 10])
+
+        line = LineColormapSolid(ax, x, x, cmapdata, interpolation_points=100)
+        (lc,) = line.plot()
+
+        expected = LineColormapBase._create_cmap(line.cmapdata)
+        assert len(line.cmapdata) == 100
+        assert lc.norm.vmin == expected.vmin
+        assert lc.norm.vmax == expected.vmax
+
+    def test_keep_explicit_interpolation_points(self, ax):
+        x = np.arange(5)
+
+        line = LineColormapSolid(ax, x, x, x, interpolation_points=3)
+        (lc,) = line.plot()
+
+        assert line.interpolation_points == 3
+        assert len(lc.get_segments()) == 2